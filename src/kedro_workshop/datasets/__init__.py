@@ -0,0 +1,6 @@
+"""Custom datasets for the kedro_workshop project."""
+
+from .chunked_parquet_dataset import ChunkedParquetDataset
+from .overpass_dataset import OverpassDataset
+
+__all__ = ["ChunkedParquetDataset", "OverpassDataset"]
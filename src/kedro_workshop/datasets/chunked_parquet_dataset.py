@@ -0,0 +1,121 @@
+"""Dataset for writing a DataFrame to Parquet one chunk at a time.
+
+Nodes that return a generator are saved chunk by chunk: Kedro calls ``save``
+once for every DataFrame the node yields. Each call writes its chunk as the
+next part file of a Parquet directory, so only one chunk has to be in memory
+at a time. Loading reads all parts back as a single DataFrame, in the order
+they were written.
+
+The type of a column can differ between chunks, e.g. a column that is empty
+(null) in the first chunk, or whole numbers in one chunk and fractions in the
+next. The part schemas are therefore unified with Arrow's permissive type
+promotion (null -> any type, int -> float, ...). Types that can't be promoted,
+like numbers in one chunk and strings in another, raise an error on save, so
+such columns need a fixed dtype when they are read.
+"""
+
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io import AbstractDataset, DatasetError
+
+PART_PATTERN = "part-*.parquet"
+
+
+class ChunkedParquetDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """Saves DataFrame chunks as the parts of a Parquet directory.
+
+    The first chunk saved by an instance (Kedro creates new instances for
+    every run) replaces any parts left by a previous run. The schemas of the
+    parts are unified, so they can be read back as one table.
+
+    Example catalog entry:
+
+    .. code-block:: yaml
+
+        staging_hdb_resale_prices:
+          type: kedro_workshop.datasets.ChunkedParquetDataset
+          filepath: data/01_staging/hdb_resale_prices
+          load_args:
+            dtype_backend: pyarrow
+          save_args:
+            compression: zstd
+    """
+
+    def __init__(
+        self,
+        *,
+        filepath: str,
+        load_args: Optional[dict[str, Any]] = None,
+        save_args: Optional[dict[str, Any]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Creates a new instance of ``ChunkedParquetDataset``.
+
+        Args:
+            filepath: Directory to write the Parquet part files to
+            load_args: Keyword arguments passed to ``pandas.read_parquet``
+            save_args: Keyword arguments passed to ``pyarrow.parquet.write_table``
+            metadata: Any arbitrary metadata, ignored by Kedro
+        """
+        super().__init__()
+        self._filepath = Path(filepath)
+        self._load_args = load_args or {}
+        self._save_args = save_args or {}
+        self.metadata = metadata
+        self._schema: Optional[pa.Schema] = None
+        self._parts_written = 0
+
+    def _describe(self) -> dict[str, Any]:
+        return {
+            "filepath": str(self._filepath),
+            "load_args": self._load_args,
+            "save_args": self._save_args,
+        }
+
+    def load(self) -> pd.DataFrame:
+        part_schemas = [pq.read_schema(part) for part in self._part_paths()]
+        schema = _unify_schemas(part_schemas) if part_schemas else None
+        return pd.read_parquet(self._filepath, schema=schema, **self._load_args)
+
+    def save(self, data: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+
+        if self._parts_written == 0:
+            # Start from an empty directory, so no stale parts are read back
+            self._filepath.mkdir(parents=True, exist_ok=True)
+            for stale_part in self._part_paths():
+                stale_part.unlink()
+            self._schema = table.schema
+        else:
+            # Fail on the chunk that doesn't fit, rather than when loading
+            try:
+                self._schema = _unify_schemas([self._schema, table.schema])
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+                raise DatasetError(
+                    f"Chunk {self._parts_written} doesn't match the schema of "
+                    f"the previous chunks: {exc}"
+                ) from exc
+
+        part_path = self._filepath / f"part-{self._parts_written:05d}.parquet"
+        pq.write_table(table, part_path, **self._save_args)
+        self._parts_written += 1
+
+    def _part_paths(self) -> list[Path]:
+        return sorted(self._filepath.glob(PART_PATTERN))
+
+    def _release(self) -> None:
+        super()._release()
+        self._schema = None
+        self._parts_written = 0
+
+    def _exists(self) -> bool:
+        return bool(self._part_paths())
+
+
+def _unify_schemas(schemas: list[pa.Schema]) -> pa.Schema:
+    """Merge part schemas, promoting column types where they differ."""
+    return pa.unify_schemas(schemas, promote_options="permissive")
@@ -0,0 +1,160 @@
+"""Dataset for querying the OpenStreetMap Overpass API.
+
+All requests go through one module-level ``requests.Session`` so repeated
+queries (MRT stations, malls, retries) reuse the same pooled keep-alive
+connection instead of doing a new DNS lookup, TCP and TLS handshake each time.
+
+The geodata behind these queries rarely changes, so responses can also be
+cached on disk, keyed by a hash of the endpoint and query. An unchanged query
+is then served from the cache without touching the network; editing the query
+changes the key and triggers a fresh download. Only complete results are
+cached: Overpass reports errors such as timeouts with HTTP 200 and a "remark"
+next to partial elements, and those responses must be fetched again.
+"""
+
+import hashlib
+import io
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+import requests
+from kedro.io import AbstractDataset, DatasetError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+DEFAULT_TIMEOUT = 60
+
+_SESSION = requests.Session()
+_SESSION.headers.update({"Connection": "keep-alive"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504)
+        ),
+    ),
+)
+
+
+def fetch_overpass(
+    query: str, url: str = OVERPASS_URL, timeout: float = DEFAULT_TIMEOUT
+) -> requests.Response:
+    """Run an Overpass QL query using the shared session.
+
+    Args:
+        query: Overpass QL query string
+        url: Overpass API interpreter endpoint
+        timeout: Request timeout in seconds
+
+    Returns:
+        HTTP response from the Overpass API
+
+    Raises:
+        DatasetError: If the server can't be reached
+    """
+    try:
+        return _SESSION.get(url, params={"data": query}, timeout=timeout)
+    except OSError as exc:
+        raise DatasetError("Failed to connect to the Overpass API") from exc
+
+
+def _cache_key(query: str, url: str) -> str:
+    """Hash the endpoint and query into a stable cache file name."""
+    return hashlib.sha256(f"{url}\n{query}".encode()).hexdigest()
+
+
+def _cached_response(path: Path, url: str) -> requests.Response:
+    """Rebuild a successful response from a cached response body."""
+    response = requests.Response()
+    response.status_code = requests.codes.ok
+    response.url = url
+    response.raw = io.BytesIO(path.read_bytes())
+    return response
+
+
+def _is_complete_result(response: requests.Response) -> bool:
+    """Check that a response holds a complete Overpass result worth caching."""
+    if response.status_code != requests.codes.ok:
+        return False
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return False
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get("elements"), list)
+        and "remark" not in data
+    )
+
+
+class OverpassDataset(AbstractDataset[None, requests.Response]):
+    """Loads the raw response of an Overpass QL query.
+
+    Example catalog entry:
+
+    .. code-block:: yaml
+
+        source_overpass_geodata:
+          type: kedro_workshop.datasets.OverpassDataset
+          query: >
+            [out:json];
+            area["ISO3166-1"="SG"][admin_level=2];
+            node(area)["subway"="yes"];
+            out;
+          cache_dir: data/01_staging/.overpass_cache
+    """
+
+    def __init__(
+        self,
+        *,
+        query: str,
+        url: str = OVERPASS_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_dir: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Creates a new instance of ``OverpassDataset``.
+
+        Args:
+            query: Overpass QL query string
+            url: Overpass API interpreter endpoint
+            timeout: Request timeout in seconds
+            cache_dir: Directory to cache complete results in, keyed by
+                a hash of the query. Caching is disabled if not set
+            metadata: Any arbitrary metadata, ignored by Kedro
+        """
+        super().__init__()
+        self._query = query
+        self._url = url
+        self._timeout = timeout
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self.metadata = metadata
+
+    def _describe(self) -> dict[str, Any]:
+        return {
+            "url": self._url,
+            "query": self._query,
+            "timeout": self._timeout,
+            "cache_dir": str(self._cache_dir) if self._cache_dir else None,
+        }
+
+    def load(self) -> requests.Response:
+        if self._cache_dir is None:
+            return fetch_overpass(self._query, url=self._url, timeout=self._timeout)
+
+        cache_path = self._cache_dir / f"{_cache_key(self._query, self._url)}.json"
+        if cache_path.is_file():
+            return _cached_response(cache_path, self._url)
+
+        response = fetch_overpass(self._query, url=self._url, timeout=self._timeout)
+        if _is_complete_result(response):
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(response.content)
+        return response
+
+    def save(self, data: None) -> None:
+        raise DatasetError(f"{self.__class__.__name__} is a read only dataset type")
@@ -0,0 +1,39 @@
+"""Project hooks.
+
+Source data validation lives here rather than in the extract nodes: the checks
+run once on the DataFrame the catalog has just loaded, so the extract nodes
+can hand the data straight to the staging layer without touching it.
+
+The HDB resale prices are read in chunks, so they are validated on their first
+chunk by ``extract_hdb_resale_prices`` instead.
+"""
+
+import logging
+from typing import Any
+
+from kedro.framework.hooks import hook_impl
+from kedro.pipeline import Node
+
+from kedro_workshop.pipelines.extract.validation import validate_dataframe_schema
+
+logger = logging.getLogger(__name__)
+
+# Source datasets to validate: dataset name -> (display name, required columns)
+SOURCE_DATASET_SCHEMAS = {
+    "source_mrt_stations": ("MRT stations", ["Name", "Line", "Code"]),
+    "source_hdb_address_geodata": ("HDB address geodata", ["latitude", "longitude"]),
+}
+
+
+class DataValidationHooks:
+    """Validates the tabular data sources as soon as they are loaded."""
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name: str, data: Any, node: Node) -> None:
+        if dataset_name not in SOURCE_DATASET_SCHEMAS:
+            return
+
+        display_name, required_columns = SOURCE_DATASET_SCHEMAS[dataset_name]
+        logger.info("Validating %d %s records", len(data), display_name)
+
+        validate_dataframe_schema(data, required_columns, display_name)
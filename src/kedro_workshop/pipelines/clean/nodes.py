@@ -4,9 +4,14 @@ from typing import Any
 import pandas as pd
 
 from .utils import (
+    STRING_DTYPE,
     convert_columns_to_numeric,
     convert_overpass_json_to_dataframe,
+    count_mrt_station_lines,
+    extract_room_count,
     handle_geodata_duplicates,
+    parse_remaining_lease,
+    parse_storey_range,
     process_overpass_geodata_coordinates,
 )
 
@@ -31,40 +36,48 @@ def clean_hdb_resale_prices(hdb_resale_prices: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info(f"Cleaning {len(hdb_resale_prices)} HDB resale price records")
 
-    df = hdb_resale_prices
+    # Shallow copy once so new columns don't modify the input frame
+    df = hdb_resale_prices.copy(deep=False)
 
     # Remove any unnamed/extra columns (like 'Column1')
-    df = df.loc[
-        :, ~df.columns.str.contains(r"^Unnamed|Column\d+$", case=False, na=False)
+    drop_columns = [
+        col
+        for col in df.columns
+        if col.lower().startswith("unnamed")
+        or (col.lower().startswith("column") and col[6:].isdigit())
     ]
+    if drop_columns:
+        df = df.drop(columns=drop_columns)
 
     # Convert month to datetime
     if "month" in df.columns:
-        df["month"] = pd.to_datetime(df["month"], format="%m/%d/%Y", errors="coerce")
+        df["month"] = pd.to_datetime(
+            df["month"], format="%m/%d/%Y", errors="coerce", cache=True
+        ).astype("datetime64[s]")
 
-    # Convert basic numeric columns
+    # Convert basic numeric columns (in place on the shallow copy)
     numeric_columns = ["resale_price", "floor_area_sqm", "lease_commence_date"]
-    df = convert_columns_to_numeric(df, numeric_columns)
+    convert_columns_to_numeric(df, numeric_columns)
+
+    # Convert text columns that get parsed below to Arrow-backed strings
+    for col in ["flat_type", "storey_range"]:
+        df[col] = df[col].astype(STRING_DTYPE)
 
     # Parse storey range to get min, max, and median storey (vectorized for speed)
     logger.info("Parsing storey ranges...")
-    split_data = df["storey_range"].str.split(" TO ", expand=True)
-    df["storey_min"] = pd.to_numeric(split_data[0], errors="coerce").fillna(0).astype(int)
-    df["storey_max"] = pd.to_numeric(split_data[1], errors="coerce").fillna(0).astype(int)
-    df["storey_median"] = (df["storey_min"] + df["storey_max"]) / 2
+    df["storey_min"], df["storey_max"], df["storey_median"] = parse_storey_range(
+        df["storey_range"]
+    )
 
     # Parse remaining lease to convert to months
     logger.info("Parsing remaining lease...")
-    df["remaining_lease_months"] = df.apply(
-        lambda row: _parse_remaining_lease(
-            row["remaining_lease"], row.get("lease_commence_date"), row.get("month")
-        ),
-        axis=1,
+    df["remaining_lease_months"] = parse_remaining_lease(
+        df["remaining_lease"], df["lease_commence_date"], df["month"]
     )
 
     # Extract room count from flat_type
     logger.info("Extracting room count...")
-    df["room_count"] = df["flat_type"].apply(_extract_room_count)
+    df["room_count"] = extract_room_count(df["flat_type"])
 
     logger.info(f"Cleaned data: {len(df)} records")
     return df
@@ -75,28 +88,31 @@ def clean_mrt_stations(mrt_stations: pd.DataFrame) -> pd.DataFrame:
 
     This function:
     1. Converts opening dates from text to proper datetime format
-    2. Filters out planned/future stations (where dates couldn't be parsed)
-    3. Counts the number of lines serving each station from station codes
+    2. Counts the number of lines serving each station from station codes
        (e.g. 'NS1 EW24' indicates 2 lines: North-South and East-West)
+    3. Filters out planned/future stations (where dates couldn't be parsed)
     """
     logger.info(f"Cleaning {len(mrt_stations)} MRT station records")
 
-    df = mrt_stations
+    # Shallow copy once so new columns don't modify the input frame
+    df = mrt_stations.copy(deep=False)
+    df["Code"] = df["Code"].astype(STRING_DTYPE)
 
     # Convert Opening column to datetime
     logger.info("Converting opening dates...")
     df["opening_date"] = pd.to_datetime(
-        df["Opening"], format="%m/%d/%Y", errors="coerce"
-    )
-
-    # Remove stations where opening date couldn't be parsed (planned stations, e.g. 'mid-2028')
-    operational_stations = df.dropna(subset=["opening_date"])
-    logger.info(f"Filtered out {len(df) - len(operational_stations)} planned stations")
-    df = operational_stations
+        df["Opening"], format="%m/%d/%Y", errors="coerce", cache=True
+    ).astype("datetime64[s]")
 
     # Count number of lines per station from station codes
+    # (done before filtering so no columns are assigned on the filtered frame)
     logger.info("Counting lines per station...")
-    df["line_count"] = df["Code"].apply(_count_mrt_station_lines)
+    df["line_count"] = count_mrt_station_lines(df["Code"])
+
+    # Remove stations where opening date couldn't be parsed (planned stations, e.g. 'mid-2028')
+    is_operational = df["opening_date"].notna()
+    logger.info(f"Filtered out {(~is_operational).sum()} planned stations")
+    df = df.loc[is_operational]
 
     logger.info(f"Cleaned data: {len(df)} operational stations")
     return df
@@ -117,9 +133,8 @@ def clean_mrt_geodata(mrt_geodata: Any) -> pd.DataFrame:
     df = process_overpass_geodata_coordinates(df)
 
     # Select only needed columns
-    df = df[["tags.name", "latitude", "longitude"]].rename(
-        columns={"tags.name": "name"}
-    )
+    df = df[["name", "latitude", "longitude"]]
+    df["name"] = df["name"].astype(STRING_DTYPE)
 
     # Remove rows without required values
     df = df.dropna(subset=["name", "latitude", "longitude"])
@@ -143,9 +158,8 @@ def clean_mall_geodata(mall_geodata: Any) -> pd.DataFrame:
     df = process_overpass_geodata_coordinates(df)
 
     # Select only needed columns
-    df = df[["tags.name", "latitude", "longitude"]].rename(
-        columns={"tags.name": "name"}
-    )
+    df = df[["name", "latitude", "longitude"]]
+    df["name"] = df["name"].astype(STRING_DTYPE)
 
     # Remove rows without required values
     df = df.dropna(subset=["name", "latitude", "longitude"])
@@ -171,94 +185,21 @@ def clean_hdb_address_geodata(hdb_address_geodata: pd.DataFrame) -> pd.DataFrame
     df = hdb_address_geodata
 
     # Filter by type - keep only "address" records (geocoding artifact)
-    address_only = df[df["type"] == "address"]
-    logger.info(f"After filtering by type='address': {len(address_only)} records")
-    df = address_only
+    is_address = df["type"] == "address"
+    logger.info(f"After filtering by type='address': {is_address.sum()} records")
 
     # Filter by confidence threshold (geocoding artifact)
-    high_confidence = df[df["confidence"] >= GEOCODING_CONFIDENCE_THRESHOLD]
+    mask = is_address & (df["confidence"] >= GEOCODING_CONFIDENCE_THRESHOLD)
+    high_confidence_count = mask.sum()
     logger.info(
-        f"After filtering by confidence >= {GEOCODING_CONFIDENCE_THRESHOLD}: {len(high_confidence)} records"
+        f"After filtering by confidence >= {GEOCODING_CONFIDENCE_THRESHOLD}: {high_confidence_count} records"
     )
-    df = high_confidence
 
     # Remove duplicates by block and street_name, keeping first occurrence
-    unique_addresses = df.drop_duplicates(subset=["block", "street_name"], keep="first")
-    duplicates_removed = len(df) - len(unique_addresses)
+    df = df.loc[mask].drop_duplicates(subset=["block", "street_name"], keep="first")
+    duplicates_removed = high_confidence_count - len(df)
     if duplicates_removed > 0:
         logger.info(f"Removed {duplicates_removed} duplicate addresses")
-    df = unique_addresses
 
     logger.info(f"Final HDB address data: {len(df)} unique, high-confidence addresses")
     return df
-
-
-
-
-def _parse_remaining_lease(lease_str, lease_commence_date, sale_date) -> int:
-    """Parse remaining lease into total months. Calculate from sale date and lease commence year if missing."""
-    import re
-
-    # Case 1: String format like "56 years 09 months" or "63 years"
-    if isinstance(lease_str, str):
-        total_months = 0
-
-        # Extract years
-        year_match = re.search(r"(\d+)\s*year", lease_str.lower())
-        if year_match:
-            total_months += int(year_match.group(1)) * 12
-
-        # Extract months
-        month_match = re.search(r"(\d+)\s*month", lease_str.lower())
-        if month_match:
-            total_months += int(month_match.group(1))
-
-        return total_months
-
-    # Case 2: Numeric (older data) - assume it's years
-    elif isinstance(lease_str, (int, float)) and not pd.isna(lease_str):
-        return int(lease_str * 12)
-
-    # Case 3: Missing - calculate from lease commence date (99-year lease standard)
-    elif (
-        pd.isna(lease_str)
-        and not pd.isna(lease_commence_date)
-        and not pd.isna(sale_date)
-    ):
-        sale_year = sale_date.year
-        years_elapsed = sale_year - int(lease_commence_date)
-        remaining_years = max(0, 99 - years_elapsed)  # HDB leases are 99 years
-        return remaining_years * 12
-
-    return 0
-
-
-def _extract_room_count(flat_type: str) -> int:
-    """Extract room count from flat_type like '3 ROOM' or special cases 'EXECUTIVE'/'MULTI-GENERATION'."""
-    try:
-        if pd.isna(flat_type):
-            return 0
-
-        flat_type = flat_type.upper().strip()
-
-        # Handle special cases
-        if "EXECUTIVE" in flat_type or "MULTI-GENERATION" in flat_type:
-            return 6
-
-        # Extract number from "3 ROOM" pattern
-        import re
-
-        room_match = re.search(r"(\d+)", flat_type)
-        if room_match:
-            return int(room_match.group(1))
-
-        return 0
-
-    except (ValueError, AttributeError):
-        return 0
-
-
-def _count_mrt_station_lines(station_code: str) -> int:
-    """Count number of lines serving a station from codes like 'NS1 EW24'."""
-    # Simply count the number of space-separated codes
-    return len(station_code.split())
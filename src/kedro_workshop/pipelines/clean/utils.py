@@ -1,32 +1,151 @@
 """Shared utilities for data cleaning operations.
 
-Contains only the reusable functions that are used by multiple
+Contains the reusable conversion and parsing functions used by the
 cleaning nodes.
 """
 
 import logging
+import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Columns extracted from Overpass API elements
+OVERPASS_COLUMNS = ["lat", "lon", "center_lat", "center_lon", "name"]
+
+# Arrow-backed strings for vectorized .str parsing
+STRING_DTYPE = "string[pyarrow]"
+
+# Patterns used when parsing text fields, compiled once at import
+_YEAR_RE = re.compile(r"(\d+)\s*year", re.IGNORECASE)
+_MONTH_RE = re.compile(r"(\d+)\s*month", re.IGNORECASE)
+_NUM_RE = re.compile(r"(\d+)")
+
 
 def convert_columns_to_numeric(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
     """Convert specified columns to numeric format, handling errors gracefully.
 
+    The columns are replaced on ``df`` itself, so callers that must not modify
+    their input should pass a (shallow) copy.
+
     Args:
         df: DataFrame to process
         columns: List of column names to convert to numeric
 
     Returns:
-        DataFrame with specified columns converted to numeric
+        The same DataFrame with specified columns converted to numeric
     """
-    df_copy = df.copy()
     for col in columns:
-        if col in df_copy.columns:
-            df_copy[col] = pd.to_numeric(df_copy[col], errors="coerce")
-    return df_copy
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+def parse_storey_range(
+    storey_range: pd.Series,
+) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """Parse storey ranges like '04 TO 06' into min, max and median storey.
+
+    Args:
+        storey_range: Series of storey range strings
+
+    Returns:
+        Tuple of (storey_min, storey_max, storey_median) series. Missing or
+        unparseable ranges give 0.
+    """
+    split_data = (
+        storey_range.astype(STRING_DTYPE)
+        .fillna("0 TO 0")
+        .str.split(" TO ", n=1, expand=True)
+    )
+    storey_min = pd.to_numeric(split_data[0], errors="coerce").fillna(0).astype("int64")
+    storey_max = pd.to_numeric(split_data[1], errors="coerce").fillna(0).astype("int64")
+    return storey_min, storey_max, (storey_min + storey_max) / 2
+
+
+def parse_remaining_lease(
+    remaining_lease: pd.Series, lease_commence_date: pd.Series, sale_date: pd.Series
+) -> pd.Series:
+    """Parse remaining lease into total months.
+
+    Handles strings like '56 years 09 months' or '63 years', numeric values
+    in years (older data, also when read as strings like '70'), and missing
+    values, which are calculated from the sale date and lease commence year
+    (99-year lease standard).
+
+    Args:
+        remaining_lease: Series of remaining lease values
+        lease_commence_date: Series of lease commencement years
+        sale_date: Series of sale dates
+
+    Returns:
+        Series of remaining lease in months, 0 where it can't be determined
+    """
+    # Numbers (also numeric strings) are handled as years, other strings parsed.
+    # Probe on object values: on Arrow-backed strings to_numeric gives NaN for
+    # text instead of NA, which isna() wouldn't catch
+    lease_num = pd.to_numeric(remaining_lease.astype(object), errors="coerce")
+    is_str = remaining_lease.map(type).eq(str) & lease_num.isna()
+    lease_str = remaining_lease.where(is_str).astype(STRING_DTYPE)
+
+    # Case 1: String format like "56 years 09 months" or "63 years"
+    years = lease_str.str.extract(_YEAR_RE, expand=False).astype("Float64")
+    months = lease_str.str.extract(_MONTH_RE, expand=False).astype("Float64")
+    months_from_str = years.fillna(0) * 12 + months.fillna(0)
+
+    # Case 2: Numeric (older data) - assume it's years
+    months_from_num = lease_num * 12
+
+    # Case 3: Missing - calculate from lease commence date (99-year lease standard)
+    years_elapsed = sale_date.dt.year - np.trunc(lease_commence_date)
+    months_from_calc = np.maximum(0, 99 - years_elapsed) * 12  # HDB leases are 99 years
+
+    total_months = np.select(
+        [lease_num.notna(), is_str, months_from_calc.notna()],
+        [months_from_num, months_from_str, months_from_calc],
+        default=0,
+    )
+    return pd.Series(total_months, index=remaining_lease.index).astype("int64")
+
+
+def extract_room_count(flat_type: pd.Series) -> pd.Series:
+    """Extract room count from flat types like '3 ROOM'.
+
+    Args:
+        flat_type: Series of flat type strings
+
+    Returns:
+        Series of room counts. 'EXECUTIVE' and 'MULTI-GENERATION' flats
+        count as 6 rooms, unrecognised values as 0.
+    """
+    flat_type = flat_type.astype(STRING_DTYPE).str.upper().str.strip()
+
+    # Extract number from "3 ROOM" pattern
+    room_count = flat_type.str.extract(_NUM_RE, expand=False).astype("Float64")
+
+    # Handle special cases
+    is_special = flat_type.str.contains("EXECUTIVE|MULTI-GENERATION", na=False)
+
+    return room_count.where(~is_special, 6).fillna(0).astype("int64")
+
+
+def count_mrt_station_lines(station_code: pd.Series) -> pd.Series:
+    """Count number of lines serving a station from codes like 'NS1 EW24'.
+
+    Args:
+        station_code: Series of space-separated station codes
+
+    Returns:
+        Series with the number of codes per station
+    """
+    station_code = station_code.astype(STRING_DTYPE).str.strip()
+
+    # Count the number of whitespace-separated codes
+    line_count = station_code.str.count(r"\s+").add(1).where(station_code != "", 0)
+    return line_count.fillna(0).astype("int64")
 
 
 def convert_overpass_json_to_dataframe(data: Any) -> pd.DataFrame:
@@ -36,10 +155,22 @@ def convert_overpass_json_to_dataframe(data: Any) -> pd.DataFrame:
         data: JSON response from Overpass API
 
     Returns:
-        DataFrame with flattened structure from JSON elements
+        DataFrame with lat, lon, center_lat, center_lon and name columns,
+        one row per JSON element
     """
-    data_dict = pd.json_normalize(data, record_path=["elements"])
-    return pd.DataFrame.from_dict(data_dict, orient="columns")  # type: ignore
+    elements = data["elements"] if isinstance(data, dict) else data
+
+    # Walk the elements once, collecting only the fields we need per column
+    columns: dict[str, list[Any]] = {column: [] for column in OVERPASS_COLUMNS}
+    for element in elements:
+        center = element.get("center", {})
+        columns["lat"].append(element.get("lat"))
+        columns["lon"].append(element.get("lon"))
+        columns["center_lat"].append(center.get("lat"))
+        columns["center_lon"].append(center.get("lon"))
+        columns["name"].append(element.get("tags", {}).get("name"))
+
+    return pd.DataFrame(columns, columns=OVERPASS_COLUMNS)
 
 
 def process_overpass_geodata_coordinates(df: pd.DataFrame) -> pd.DataFrame:
@@ -47,7 +178,7 @@ def process_overpass_geodata_coordinates(df: pd.DataFrame) -> pd.DataFrame:
 
     Overpass API returns coordinates in different formats:
     - Direct lat/lon fields for points
-    - center.lat/center.lon for complex shapes
+    - center_lat/center_lon for complex shapes
 
     This function coalesces them into standard latitude/longitude columns.
 
@@ -57,12 +188,14 @@ def process_overpass_geodata_coordinates(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with standardized latitude/longitude columns
     """
-    # Coalesce lat/center.lat and lon/center.lon
-    center_lat = df.get("center.lat", pd.Series(index=df.index, dtype="float64"))
-    center_lon = df.get("center.lon", pd.Series(index=df.index, dtype="float64"))
+    # Coalesce lat/center_lat and lon/center_lon directly on the NumPy arrays
+    lat = df["lat"].to_numpy(dtype="float64", na_value=np.nan)
+    lon = df["lon"].to_numpy(dtype="float64", na_value=np.nan)
+    center_lat = df["center_lat"].to_numpy(dtype="float64", na_value=np.nan)
+    center_lon = df["center_lon"].to_numpy(dtype="float64", na_value=np.nan)
 
-    df["latitude"] = df["lat"].fillna(center_lat)
-    df["longitude"] = df["lon"].fillna(center_lon)
+    df["latitude"] = np.where(np.isnan(lat), center_lat, lat)
+    df["longitude"] = np.where(np.isnan(lon), center_lon, lon)
 
     return df
 
@@ -83,8 +216,13 @@ def handle_geodata_duplicates(df: pd.DataFrame, location_type: str) -> pd.DataFr
     if len(df) == 0:
         return df
 
-    cleaned_df = (
-        df.groupby("name").agg({"latitude": "mean", "longitude": "mean"}).reset_index()
+    # Average coordinates per name code, keeping names in order of appearance
+    codes, names = pd.factorize(df["name"])
+    counts = np.bincount(codes)
+    latitude = np.bincount(codes, weights=df["latitude"].to_numpy()) / counts
+    longitude = np.bincount(codes, weights=df["longitude"].to_numpy()) / counts
+    cleaned_df = pd.DataFrame(
+        {"name": names, "latitude": latitude, "longitude": longitude}
     )
 
     duplicates_removed = len(df) - len(cleaned_df)
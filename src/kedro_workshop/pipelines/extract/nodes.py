@@ -2,138 +2,161 @@
 
 This module contains the extraction nodes that:
 1. Load data from various sources (CSV files, Excel files, APIs)
-2. Perform basic validation and logging
+2. Perform basic validation and logging (tabular sources are validated
+   on load by ``kedro_workshop.hooks.DataValidationHooks``)
 3. Pass clean data to the next pipeline stage
 """
 
 import logging
-from typing import Any, Dict
+from collections.abc import Iterator
+from typing import Any
 
+import orjson
 import pandas as pd
+import pyarrow as pa
 import requests
 
 from .validation import (
     validate_data_quantity,
     validate_api_response_success,
-    validate_dataframe_not_empty,
+    validate_dataframe_schema,
     validate_overpass_data_structure,
-    validate_required_columns,
 )
 
 logger = logging.getLogger(__name__)
 
+# Overpass tag (key, value) identifying the elements of each dataset
+OVERPASS_DATASET_TAGS = {
+    "mrt": ("subway", "yes"),
+    "mall": ("shop", "mall"),
+}
 
-def extract_hdb_resale_prices(hdb_resale_prices: pd.DataFrame) -> pd.DataFrame:
+
+def extract_hdb_resale_prices(
+    hdb_resale_prices: Iterator[pd.DataFrame],
+) -> Iterator[pd.DataFrame]:
     """Extract and validate HDB resale price data.
 
-    This node processes HDB resale transaction data, checking for:
+    The source CSV is read in chunks (see ``chunksize`` in the catalog) and
+    each chunk is passed on to the staging dataset as soon as it is parsed,
+    so the whole file is never held in memory. The schema is checked on the
+    first chunk, before anything is written:
     - Non-empty dataset
     - Required columns for downstream analysis
     """
-    logger.info(f"Processing {len(hdb_resale_prices)} HDB resale records")
+    chunks = iter(hdb_resale_prices)
+    first_chunk = next(chunks, pd.DataFrame())
 
     # Validate data quality using shared utilities
-    validate_dataframe_not_empty(hdb_resale_prices, "HDB resale prices")
-
     required_columns = ["town", "resale_price", "flat_type", "floor_area_sqm"]
-    validate_required_columns(hdb_resale_prices, required_columns, "HDB resale prices")
+    validate_dataframe_schema(first_chunk, required_columns, "HDB resale prices")
 
-    return hdb_resale_prices
+    record_count = len(first_chunk)
+    yield first_chunk
+    for chunk in chunks:
+        record_count += len(chunk)
+        yield chunk
+
+    logger.info("Processed %d HDB resale records", record_count)
 
 
 def extract_mrt_stations(mrt_stations: pd.DataFrame) -> pd.DataFrame:
-    """Extract and validate MRT station reference data.
+    """Stage MRT station reference data for the cleaning pipeline.
 
-    This node processes MRT station information, checking for:
-    - Non-empty dataset
-    - Required columns for station identification
+    The source is validated by ``DataValidationHooks`` when it is loaded
+    (non-empty, required columns present), so the data is passed through as-is.
     """
-    logger.info(f"Processing {len(mrt_stations)} MRT station records")
-
-    # Validate data quality using shared utilities
-    validate_dataframe_not_empty(mrt_stations, "MRT stations")
-
-    required_columns = ["Name", "Line", "Code"]
-    validate_required_columns(mrt_stations, required_columns, "MRT stations")
-
     return mrt_stations
 
 
-def extract_mrt_geodata(mrt_geodata: requests.Response) -> Dict[str, Any]:
-    """Extract MRT station geographic data from Overpass API.
+def extract_overpass_geodata(overpass_geodata: requests.Response) -> dict[str, Any]:
+    """Extract MRT station and shopping mall geodata from Overpass API.
 
-    This node processes API response data containing MRT station locations.
-    It demonstrates how to handle external API data with proper validation.
+    Both datasets are fetched with a single Overpass query, so the whole
+    extract pipeline waits for one API round-trip instead of two. The
+    response elements are split by their tags into one Overpass-style
+    response per dataset.
     """
     try:
         # Validate API response using shared utilities
-        validate_api_response_success(mrt_geodata)
-
-        # Parse and validate JSON structure
-        data = mrt_geodata.json()
-        validate_overpass_data_structure(data)
-
-        # Extract elements and log results
-        elements = data.get("elements", [])
-        logger.info(f"Extracted {len(elements)} MRT station geodata records")
-
-        # Quality checks for workshop demonstration
-        validate_data_quantity(len(elements), 50, "MRT stations")
-
-        return data
-
-    except requests.exceptions.JSONDecodeError as e:
+        validate_api_response_success(overpass_geodata)
+
+        # Parse and validate JSON structure (orjson is much faster on large payloads)
+        data = orjson.loads(overpass_geodata.content)
+        elements = validate_overpass_data_structure(data)
+
+        # Log results
+        logger.info("Extracted %d Overpass geodata records", len(elements))
+
+        # Split elements into the datasets they were queried for
+        return {
+            dataset: {
+                **data,
+                "elements": [
+                    element
+                    for element in elements
+                    if element.get("tags", {}).get(tag) == value
+                ],
+            }
+            for dataset, (tag, value) in OVERPASS_DATASET_TAGS.items()
+        }
+
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON response: {e}")
     except Exception as e:
-        logger.error(f"Error extracting MRT geodata: {e}")
+        logger.error("Error extracting Overpass geodata: %s", e)
         raise
 
 
-def extract_mall_geodata(mall_geodata: requests.Response) -> Dict[str, Any]:
-    """Extract shopping mall geographic data from Overpass API.
+def extract_mrt_geodata(overpass_geodata: dict[str, Any]) -> dict[str, Any]:
+    """Extract MRT station geographic data from the Overpass API response.
 
-    This node processes API response data containing shopping mall locations.
-    Similar pattern to MRT geodata extraction but for retail locations.
+    This node selects the MRT station locations from the combined Overpass
+    response and checks that a plausible number of stations was returned.
     """
-    try:
-        # Validate API response using shared utilities
-        validate_api_response_success(mall_geodata)
+    data = overpass_geodata["mrt"]
+    elements = data["elements"]
+    logger.info("Extracted %d MRT station geodata records", len(elements))
 
-        # Parse and validate JSON structure
-        data = mall_geodata.json()
-        validate_overpass_data_structure(data)
+    # Quality checks for workshop demonstration
+    validate_data_quantity(len(elements), 50, "MRT stations")
 
-        # Extract elements and log results
-        elements = data.get("elements", [])
-        logger.info(f"Extracted {len(elements)} shopping mall geodata records")
+    return data
 
-        # Quality checks for workshop demonstration
-        validate_data_quantity(len(elements), 10, "shopping malls")
 
-        return data
+def extract_mall_geodata(overpass_geodata: dict[str, Any]) -> dict[str, Any]:
+    """Extract shopping mall geographic data from the Overpass API response.
 
-    except requests.exceptions.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse JSON response: {e}")
-    except Exception as e:
-        logger.error(f"Error extracting mall geodata: {e}")
-        raise
+    Similar pattern to MRT geodata extraction but for retail locations.
+    """
+    data = overpass_geodata["mall"]
+    elements = data["elements"]
+    logger.info("Extracted %d shopping mall geodata records", len(elements))
 
+    # Malls are mapped as nodes, ways or relations - log the breakdown
+    element_types = pa.array(
+        (element.get("type", "unknown") for element in elements), type=pa.string()
+    )
+    type_counts = element_types.value_counts()
+    mall_types = dict(
+        zip(
+            type_counts.field("values").to_pylist(),
+            type_counts.field("counts").to_pylist(),
+        )
+    )
+    logger.info("Mall element types: %s", mall_types)
 
-def extract_hdb_address_geodata(hdb_address_geodata: pd.DataFrame) -> pd.DataFrame:
-    """Extract and validate HDB address geographic data.
+    # Quality checks for workshop demonstration
+    validate_data_quantity(len(elements), 10, "shopping malls")
 
-    This node processes HDB address coordinates that will be used
-    to calculate distances to amenities like MRT stations and malls.
-    """
-    logger.info(f"Processing {len(hdb_address_geodata)} HDB address records")
-    logger.info(f"Data shape: {hdb_address_geodata.shape}")
+    return data
 
-    # Validate data quality using shared utilities
-    validate_dataframe_not_empty(hdb_address_geodata, "HDB address geodata")
 
-    required_columns = ["latitude", "longitude"]
-    validate_required_columns(
-        hdb_address_geodata, required_columns, "HDB address geodata"
-    )
+def extract_hdb_address_geodata(hdb_address_geodata: pd.DataFrame) -> pd.DataFrame:
+    """Stage HDB address coordinates for the cleaning pipeline.
 
+    These coordinates are used to calculate distances to amenities like MRT
+    stations and malls. The source is validated by ``DataValidationHooks``
+    when it is loaded, so the data is passed through as-is.
+    """
     return hdb_address_geodata
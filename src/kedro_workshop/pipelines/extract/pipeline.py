@@ -6,6 +6,7 @@ from .nodes import (
     extract_mall_geodata,
     extract_mrt_geodata,
     extract_mrt_stations,
+    extract_overpass_geodata,
 )
 
 
@@ -15,11 +16,12 @@ def create_pipeline(**kwargs) -> Pipeline:
     This pipeline extracts raw data from various sources:
     - HDB resale prices from CSV files
     - MRT station reference data from an Excel file
-    - MRT and mall geodata from Overpass API responses
+    - MRT and mall geodata from a single Overpass API response
     - HDB address coordinates from preprocessed data
 
-    Each node does some sanity checks on the data and then stores
-    it for the next pipeline stage (cleaning).
+    Each node stores its data for the next pipeline stage (cleaning). The
+    tabular sources are sanity checked by ``DataValidationHooks`` as they are
+    loaded, the Overpass nodes check the API response themselves.
 
     The data sources are defined in the data catalog (conf/base/catalog.yml)
     """
@@ -37,15 +39,21 @@ def create_pipeline(**kwargs) -> Pipeline:
                 outputs="staging_mrt_stations",
                 name="extract_mrt_stations_node",
             ),
+            Node(
+                func=extract_overpass_geodata,
+                inputs="source_overpass_geodata",
+                outputs="overpass_geodata",
+                name="extract_overpass_geodata_node",
+            ),
             Node(
                 func=extract_mrt_geodata,
-                inputs="source_mrt_geodata",
+                inputs="overpass_geodata",
                 outputs="staging_mrt_geodata",
                 name="extract_mrt_geodata_node",
             ),
             Node(
                 func=extract_mall_geodata,
-                inputs="source_mall_geodata",
+                inputs="overpass_geodata",
                 outputs="staging_mall_geodata",
                 name="extract_mall_geodata_node",
             ),
@@ -42,9 +42,31 @@ def validate_required_columns(
         Logs warnings for missing columns but doesn't raise exceptions,
         allowing pipeline to continue with available data.
     """
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    missing_columns = set(required_columns).difference(df.columns)
     if missing_columns:
-        logger.warning(f"Missing expected columns in {dataset_name}: {missing_columns}")
+        logger.warning(
+            f"Missing expected columns in {dataset_name}: {sorted(missing_columns)}"
+        )
+
+
+def validate_dataframe_schema(
+    df: pd.DataFrame, required_columns: list[str], dataset_name: str
+) -> None:
+    """Run the standard checks for a tabular data source.
+
+    Combines ``validate_dataframe_not_empty`` and ``validate_required_columns``,
+    so every tabular source is validated the same way.
+
+    Args:
+        df: DataFrame to validate
+        required_columns: List of column names that must be present
+        dataset_name: Human-readable name for logging
+
+    Raises:
+        ValueError: If dataframe is empty
+    """
+    validate_dataframe_not_empty(df, dataset_name)
+    validate_required_columns(df, required_columns, dataset_name)
 
 
 def validate_api_response_success(response: requests.Response) -> None:
@@ -63,12 +85,15 @@ def validate_api_response_success(response: requests.Response) -> None:
         )
 
 
-def validate_overpass_data_structure(data: Any) -> None:
+def validate_overpass_data_structure(data: Any) -> list[dict[str, Any]]:
     """Check if Overpass API response has expected structure.
 
     Args:
         data: Parsed JSON response from Overpass API
 
+    Returns:
+        The 'elements' array of the response
+
     Raises:
         ValueError: If data structure is invalid
 
@@ -76,11 +101,12 @@ def validate_overpass_data_structure(data: Any) -> None:
         Overpass API returns data in a specific format with an 'elements' array.
         This validates the basic structure before processing.
     """
-    if not isinstance(data, dict):
-        raise ValueError("API response is not a valid JSON object")
-
-    if "elements" not in data:
-        raise ValueError("API response missing 'elements' field")
+    try:
+        return data["elements"]
+    except KeyError:
+        raise ValueError("API response missing 'elements' field") from None
+    except TypeError:
+        raise ValueError("API response is not a valid JSON object") from None
 
 
 def validate_data_quantity(
@@ -4,15 +4,19 @@ Contains reusable functions for preparing data for training and evaluation,
 ensuring consistency across different nodes in the pipeline.
 """
 
+import math
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
 
 
 def prepare_features_and_target(feature_set: pd.DataFrame, target_column: str = 'resale_price') -> Tuple[pd.DataFrame, pd.Series]:
     """Separate features and target variable from feature set.
     
+    Features and target are cast to float32, which halves the memory traffic
+    of fitting and predicting with no meaningful loss of accuracy for prices.
+    
     Args:
         feature_set: Complete dataset with features and target
         target_column: Name of target variable column
@@ -20,25 +24,29 @@ def prepare_features_and_target(feature_set: pd.DataFrame, target_column: str =
     Returns:
         Tuple of (features_df, target_series)
     """
-    X = feature_set.drop(target_column, axis=1)
-    y = feature_set[target_column]
+    X = feature_set.drop(target_column, axis=1).astype(np.float32, copy=False)
+    y = feature_set[target_column].astype(np.float32, copy=False)
     return X, y
 
 
-def create_train_test_split(X: pd.DataFrame, y: pd.Series, test_size: float = 0.2, 
-                           random_state: int = 42) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
-    """Create consistent train/test split for model training and evaluation.
-    
-    Uses the same random state across all functions to ensure consistency
-    between training and plotting/evaluation.
-    
+def create_train_test_split(
+    X: pd.DataFrame, y: pd.Series, test_size: float = 0.2
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+    """Create a train/test split from contiguous slices of pre-shuffled data.
+
+    The feature set is shuffled once when it is built (see the transform
+    pipeline), so the first rows can be used for training and the rest for
+    testing. Slicing avoids the random permutation and the row gathers done
+    by sklearn's train_test_split. The test set size is rounded up like in
+    train_test_split.
+
     Args:
-        X: Feature dataframe
-        y: Target series
+        X: Feature dataframe, already shuffled
+        y: Target series, in the same order as X
         test_size: Proportion of data to use for testing
-        random_state: Random seed for reproducible splits
-        
+
     Returns:
         Tuple of (X_train, X_test, y_train, y_test)
     """
-    return train_test_split(X, y, test_size=test_size, random_state=random_state)
\ No newline at end of file
+    n_train = len(X) - math.ceil(test_size * len(X))
+    return X.iloc[:n_train], X.iloc[n_train:], y.iloc[:n_train], y.iloc[n_train:]
@@ -0,0 +1,55 @@
+"""Regression metrics for model evaluation and plotting.
+
+Shared by the training node and the plot utilities, so the reported metrics
+and the ones shown on the analysis figure are always calculated the same way.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def calculate_regression_metrics(
+    y_true: pd.Series, y_pred: np.ndarray
+) -> dict[str, float]:
+    """Calculate regression metrics from a single residual vector.
+
+    Equivalent to sklearn's r2_score, mean_squared_error, mean_absolute_error
+    and root_mean_squared_error, but the residuals are only computed once
+    instead of once per metric. float32 inputs are not upcast; the sums are
+    accumulated in float64 instead, so precision is kept without copying.
+
+    Args:
+        y_true: Series of actual target values
+        y_pred: Array of predicted values
+
+    Returns:
+        Dictionary with 'r2', 'mse', 'mae' and 'rmse'
+
+    Raises:
+        ValueError: If there are no values to score
+    """
+    y_true = np.asarray(y_true)
+    if y_true.size == 0:
+        raise ValueError("Cannot calculate regression metrics without any values")
+
+    y_true = y_true.astype(np.promote_types(y_true.dtype, np.float32), copy=False)
+    residuals = y_true - y_pred
+    sse = float(np.einsum("i,i->", residuals, residuals, dtype=np.float64))
+
+    y_mean = y_true.mean(dtype=np.float64)
+    deviations = y_true - y_true.dtype.type(y_mean)
+    sst = float(np.einsum("i,i->", deviations, deviations, dtype=np.float64))
+
+    # Like sklearn, a constant target scores 1.0 if predicted exactly, else 0.0
+    if sst == 0:
+        r2 = 1.0 if sse == 0 else 0.0
+    else:
+        r2 = 1 - sse / sst
+
+    mse = sse / residuals.size
+    return {
+        "r2": r2,
+        "mse": mse,
+        "mae": float(np.abs(residuals).mean(dtype=np.float64)),
+        "rmse": float(np.sqrt(mse)),
+    }
@@ -5,100 +5,138 @@ Model pipeline for training and evaluating linear regression on HDB resale price
 import logging
 from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 from matplotlib.figure import Figure
+from scipy.linalg import cho_factor, cho_solve
 from sklearn.linear_model import LinearRegression
-from sklearn.metrics import (
-    mean_squared_error,
-    r2_score,
-    mean_absolute_error,
-    root_mean_squared_error,
-)
 
 from .data_utils import create_train_test_split, prepare_features_and_target
+from .metrics import calculate_regression_metrics
 from .plot_utils import create_model_analysis_figure
 
 logger = logging.getLogger(__name__)
 
 # Constants (TODO: move to parameters)
 TEST_SIZE = 0.2
-RANDOM_STATE = 42
 FIGURE_SIZE = (15, 12)
 
+# Above this condition number of XᵀX the normal equations lose too much precision
+MAX_GRAM_CONDITION = 1e12
 
-def train_linear_regression(feature_set: pd.DataFrame) -> Tuple[LinearRegression, Dict]:
+
+def _fit_linear_regression(X: pd.DataFrame, y: pd.Series) -> LinearRegression:
+    """Fit ordinary least squares by solving the normal equations.
+
+    With only a handful of features, a Cholesky solve of XᵀXβ = Xᵀy is much
+    cheaper than the SVD-based solver behind LinearRegression.fit. The solution
+    is stored on a regular LinearRegression, so predict() and pickling work as
+    usual. Falls back to LinearRegression.fit if XᵀX is ill-conditioned.
+
+    The products with the data are computed in the precision of X and y
+    (float32 from ``prepare_features_and_target``); only the small
+    features x features system is solved in float64.
+    """
+    # Center the data so the intercept drops out of the system, like sklearn
+    X_values = X.to_numpy()
+    y_values = y.to_numpy()
+    X_mean = X_values.mean(axis=0, dtype=np.float64)
+    y_mean = y_values.mean(dtype=np.float64)
+    X_centered = X_values - X_mean.astype(X_values.dtype)
+    y_centered = y_values - y_values.dtype.type(y_mean)
+
+    gram = (X_centered.T @ X_centered).astype(np.float64)
+    if np.linalg.cond(gram) < MAX_GRAM_CONDITION:
+        moment = (X_centered.T @ y_centered).astype(np.float64)
+        coef = cho_solve(cho_factor(gram), moment)
+
+        model = LinearRegression()
+        model.coef_ = coef
+        model.intercept_ = y_mean - X_mean @ coef
+        model.n_features_in_ = X.shape[1]
+        model.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        return model
+
+    logger.warning("Features are ill-conditioned, using LinearRegression.fit instead")
+    return LinearRegression().fit(X, y)
+
+
+def split_features_target(feature_set: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+    """Separate the feature set into features and target variable.
+
+    Done once as its own node, so the feature matrix is only materialized
+    once for all model nodes that need it.
+
+    Args:
+        feature_set: ML-ready dataset with features and target
+
+    Returns:
+        Tuple of (features_X, target_y)
+    """
+    return prepare_features_and_target(feature_set)
+
+
+def train_linear_regression(
+    X: pd.DataFrame, y: pd.Series
+) -> Tuple[LinearRegression, Dict, pd.DataFrame, pd.Series]:
     """Train a linear regression model on the feature set.
 
     This function:
-    1. Separates features from target variable
-    2. Splits data into training and test sets
-    3. Trains a linear regression model
-    4. Evaluates performance on both sets
-    5. Returns model and comprehensive evaluation metrics
+    1. Splits data into training and test sets
+    2. Trains a linear regression model
+    3. Evaluates performance on both sets
+    4. Returns model, comprehensive evaluation metrics and the test set
 
     Args:
-        feature_set: ML-ready dataset with features and target
+        X: Features from ``split_features_target``
+        y: Target variable from ``split_features_target``
 
     Returns:
-        Tuple of (trained_model, model_info_dict)
+        Tuple of (trained_model, model_info_dict, X_test, y_test). The test
+        set is passed on to plotting so the split is only done once.
     """
     logger.info("Training linear regression model")
 
-    # Prepare data using utilities
-    X, y = prepare_features_and_target(feature_set)
     X_train, X_test, y_train, y_test = create_train_test_split(
-        X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE
+        X, y, test_size=TEST_SIZE
     )
 
-    logger.info(f"Training set: {len(X_train)} samples")
-    logger.info(f"Test set: {len(X_test)} samples")
-    logger.info(f"Features: {list(X.columns)}")
+    logger.info("Training set: %d samples", len(X_train))
+    logger.info("Test set: %d samples", len(X_test))
+    logger.info("Features: %s", X.columns.tolist())
 
     # Train the model
-    model = LinearRegression()
-    model.fit(X_train, y_train)
+    model = _fit_linear_regression(X_train, y_train)
 
     # Make predictions
     y_train_pred = model.predict(X_train)
     y_test_pred = model.predict(X_test)
 
     # Calculate metrics
-    train_metrics = {
-        "r2": r2_score(y_train, y_train_pred),
-        "mse": mean_squared_error(y_train, y_train_pred),
-        "mae": mean_absolute_error(y_train, y_train_pred),
-        "rmse": root_mean_squared_error(y_train, y_train_pred),
-    }
-
-    test_metrics = {
-        "r2": r2_score(y_test, y_test_pred),
-        "mse": mean_squared_error(y_test, y_test_pred),
-        "mae": mean_absolute_error(y_test, y_test_pred),
-        "rmse": root_mean_squared_error(y_test, y_test_pred),
-    }
+    train_metrics = calculate_regression_metrics(y_train, y_train_pred)
+    test_metrics = calculate_regression_metrics(y_test, y_test_pred)
 
     # Feature importance (coefficients)
     # Note: Features are currently not normalized, so the importance may be misleading.
-    feature_importance = {
-        feature: coef for feature, coef in zip(X.columns, model.coef_)
-    }
+    feature_importance = dict(zip(X.columns.tolist(), model.coef_.tolist()))
 
     model_info = {
         "train_metrics": train_metrics,
         "test_metrics": test_metrics,
         "feature_importance": feature_importance,
-        "intercept": model.intercept_,
+        "intercept": float(model.intercept_),
         "n_features": len(X.columns),
         "n_train_samples": len(X_train),
         "n_test_samples": len(X_test),
     }
 
-    logger.info(f"Model trained successfully!")
-    logger.info(f"Train R²: {train_metrics['r2']:.4f}")
-    logger.info(f"Test R²: {test_metrics['r2']:.4f}")
-    logger.info(f"Test RMSE: ${test_metrics['rmse']:,.0f}")
+    logger.info("Model trained successfully!")
+    logger.info("Train R²: %.4f", train_metrics["r2"])
+    logger.info("Test R²: %.4f", test_metrics["r2"])
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Test RMSE: ${test_metrics['rmse']:,.0f}")
 
-    return model, model_info
+    return model, model_info, X_test, y_test
 
 
 def evaluate_model_performance(model_info: Dict) -> pd.DataFrame:
@@ -109,37 +147,35 @@ def evaluate_model_performance(model_info: Dict) -> pd.DataFrame:
     train_metrics = model_info["train_metrics"]
     test_metrics = model_info["test_metrics"]
 
-    # Create performance summary
-    performance_data = [
-        {
-            "Metric": "R² Score",
-            "Train": train_metrics["r2"],
-            "Test": test_metrics["r2"],
-        },
-        {
-            "Metric": "RMSE ($)",
-            "Train": train_metrics["rmse"],
-            "Test": test_metrics["rmse"],
-        },
+    # Create performance summary, one row per metric
+    metric_labels = {
+        "r2": "R² Score",
+        "rmse": "RMSE ($)",
+        "mae": "MAE ($)",
+        "mse": "MSE",
+    }
+    performance_df = pd.DataFrame.from_dict(
         {
-            "Metric": "MAE ($)",
-            "Train": train_metrics["mae"],
-            "Test": test_metrics["mae"],
+            "Metric": list(metric_labels.values()),
+            "Train": [train_metrics[metric] for metric in metric_labels],
+            "Test": [test_metrics[metric] for metric in metric_labels],
         },
-        {"Metric": "MSE", "Train": train_metrics["mse"], "Test": test_metrics["mse"]},
-    ]
-
-    performance_df = pd.DataFrame(performance_data)
+        orient="columns",
+    )
 
     logger.info("Model Performance Summary:")
-    logger.info(f"Test R² Score: {test_metrics['r2']:.4f}")
-    logger.info(f"Test RMSE: ${test_metrics['rmse']:,.0f}")
-    logger.info(f"Test MAE: ${test_metrics['mae']:,.0f}")
+    logger.info("Test R² Score: %.4f", test_metrics["r2"])
+    if logger.isEnabledFor(logging.INFO):
+        # Thousands separators need str.format, so only format when logged
+        logger.info(f"Test RMSE: ${test_metrics['rmse']:,.0f}")
+        logger.info(f"Test MAE: ${test_metrics['mae']:,.0f}")
 
     return performance_df
 
 
-def create_model_plots(model: LinearRegression, feature_set: pd.DataFrame) -> Figure:
+def create_model_plots(
+    model: LinearRegression, X_test: pd.DataFrame, y_test: pd.Series
+) -> Figure:
     """Create comprehensive visualization plots for the linear regression model.
 
     Generates a 2x2 grid of plots to analyze model performance:
@@ -150,19 +186,14 @@ def create_model_plots(model: LinearRegression, feature_set: pd.DataFrame) -> Fi
 
     Args:
         model: Trained linear regression model
-        feature_set: Same dataset used for training
+        X_test: Test set features from training
+        y_test: Test set target from training
 
     Returns:
         Matplotlib figure with comprehensive model analysis
     """
     logger.info("Creating model visualization plots")
 
-    # Prepare data using same utilities as training
-    X, y = prepare_features_and_target(feature_set)
-    X_train, X_test, y_train, y_test = create_train_test_split(
-        X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE
-    )
-
     # Make predictions on test set
     y_test_pred = model.predict(X_test)
 
@@ -170,7 +201,7 @@ def create_model_plots(model: LinearRegression, feature_set: pd.DataFrame) -> Fi
     fig = create_model_analysis_figure(
         y_actual=y_test,
         y_predicted=y_test_pred,
-        feature_names=X.columns,
+        feature_names=X_test.columns,
         coefficients=model.coef_,
         figure_size=FIGURE_SIZE,
     )
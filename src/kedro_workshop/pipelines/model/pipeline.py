@@ -4,15 +4,26 @@ Model pipeline for training and evaluating linear regression on HDB resale price
 
 from kedro.pipeline import Node, Pipeline, node
 
-from .nodes import train_linear_regression, evaluate_model_performance, create_model_plots
+from .nodes import (
+    split_features_target,
+    train_linear_regression,
+    evaluate_model_performance,
+    create_model_plots,
+)
 
 
 def create_pipeline(**kwargs) -> Pipeline:
     return Pipeline([
         node(
-            func=train_linear_regression,
+            func=split_features_target,
             inputs="transformed_feature_set",
-            outputs=["linear_regression_model", "model_info"],
+            outputs=["features_X", "target_y"],
+            name="split_features_target_node",
+        ),
+        node(
+            func=train_linear_regression,
+            inputs=["features_X", "target_y"],
+            outputs=["linear_regression_model", "model_info", "X_test", "y_test"],
             name="train_linear_regression_node",
         ),
         node(
@@ -23,7 +34,7 @@ def create_pipeline(**kwargs) -> Pipeline:
         ),
         node(
             func=create_model_plots,
-            inputs=["linear_regression_model", "transformed_feature_set"],
+            inputs=["linear_regression_model", "X_test", "y_test"],
             outputs="model_plots",
             name="create_model_plots_node",
         ),
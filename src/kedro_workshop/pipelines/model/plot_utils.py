@@ -15,11 +15,8 @@ from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 import numpy as np
 import pandas as pd
-from sklearn.metrics import (
-    mean_absolute_error,
-    r2_score,
-    root_mean_squared_error,
-)
+
+from .metrics import calculate_regression_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +34,8 @@ def create_actual_vs_predicted_plot(
         y_actual: Series of actual target values
         y_predicted: Array of predicted values
     """
-    ax.scatter(y_actual, y_predicted, alpha=0.5, s=1)
+    # Rasterize the (many) points, the axes and labels stay vector graphics
+    ax.scatter(y_actual, y_predicted, alpha=0.5, s=1, rasterized=True)
 
     # Add perfect prediction line (diagonal)
     min_val = min(y_actual.min(), y_predicted.min())
@@ -68,7 +66,7 @@ def create_residuals_plot(
         y_predicted: Array of predicted values
     """
     residuals = y_actual - y_predicted
-    ax.scatter(y_predicted, residuals, alpha=0.5, s=1)
+    ax.scatter(y_predicted, residuals, alpha=0.5, s=1, rasterized=True)
     ax.axhline(y=0, color="r", linestyle="--", lw=2)
 
     ax.set_xlabel("Predicted Price ($)")
@@ -90,43 +88,26 @@ def create_feature_importance_plot(
         feature_names: Names of features
         coefficients: Linear regression coefficients for each feature
     """
-    # Create DataFrame for easy sorting
-    feature_importance = pd.DataFrame(
-        {
-            "feature": feature_names,
-            "coefficient": coefficients,
-            "abs_coefficient": abs(coefficients),
-        }
-    ).sort_values("abs_coefficient", ascending=True)
+    # Sort features by absolute coefficient (largest bar ends up on top)
+    order = np.argsort(np.abs(coefficients))
+    sorted_coefficients = np.asarray(coefficients)[order]
+    sorted_features = np.asarray(feature_names)[order]
 
     # Color bars based on positive/negative coefficients
-    colors = [
-        "red" if coef < 0 else "blue" for coef in feature_importance["coefficient"]
-    ]
-    bars = ax.barh(
-        feature_importance["feature"],
-        feature_importance["coefficient"],
-        color=colors,
-        alpha=0.7,
-    )
+    colors = np.where(sorted_coefficients < 0, "red", "blue")
+    bars = ax.barh(sorted_features, sorted_coefficients, color=colors, alpha=0.7)
 
     ax.set_xlabel("Coefficient Value ($)")
     ax.set_title("Feature Importance (Coefficients)")
     ax.grid(True, alpha=0.3, axis="x")
 
-    # Add value labels on bars
-    for i, bar in enumerate(bars):
-        width = bar.get_width()
-        # Position text slightly offset from bar end
-        offset = (max(coefficients) - min(coefficients)) * 0.01
-        ax.text(
-            width + offset,
-            bar.get_y() + bar.get_height() / 2,
-            f"${width:,.0f}",
-            ha="left" if width >= 0 else "right",
-            va="center",
-            fontsize=9,
-        )
+    # Add value labels at the end of each bar
+    ax.bar_label(
+        bars,
+        labels=[f"${coef:,.0f}" for coef in sorted_coefficients],
+        padding=3,
+        fontsize=9,
+    )
 
 
 def create_distribution_comparison_plot(
@@ -142,9 +123,32 @@ def create_distribution_comparison_plot(
         y_actual: Series of actual target values
         y_predicted: Array of predicted values
     """
-    ax.hist(y_actual, bins=50, alpha=0.7, label="Actual", density=True, color="blue")
-    ax.hist(
-        y_predicted, bins=50, alpha=0.7, label="Predicted", density=True, color="red"
+    # Use the same 50 bins for both, so the bars line up for comparison
+    low = min(y_actual.min(), y_predicted.min())
+    high = max(y_actual.max(), y_predicted.max())
+    bin_edges = np.linspace(low, high, 51)
+    bin_widths = np.diff(bin_edges)
+
+    actual_density, _ = np.histogram(y_actual, bins=bin_edges, density=True)
+    predicted_density, _ = np.histogram(y_predicted, bins=bin_edges, density=True)
+
+    ax.bar(
+        bin_edges[:-1],
+        actual_density,
+        width=bin_widths,
+        align="edge",
+        alpha=0.7,
+        label="Actual",
+        color="blue",
+    )
+    ax.bar(
+        bin_edges[:-1],
+        predicted_density,
+        width=bin_widths,
+        align="edge",
+        alpha=0.7,
+        label="Predicted",
+        color="red",
     )
 
     ax.set_xlabel("Price ($)")
@@ -164,13 +168,15 @@ def add_metrics_text_box(
         y_actual: Series of actual target values
         y_predicted: Array of predicted values
     """
-    # Calculate metrics
-    r2 = r2_score(y_actual, y_predicted)
-    rmse = root_mean_squared_error(y_actual, y_predicted)
-    mae = mean_absolute_error(y_actual, y_predicted)
+    # Calculate metrics (all from one pass over the residuals)
+    metrics = calculate_regression_metrics(y_actual, y_predicted)
 
     # Create formatted text
-    metrics_text = f"R² = {r2:.3f}\nRMSE = ${rmse:,.0f}\nMAE = ${mae:,.0f}"
+    metrics_text = (
+        f"R² = {metrics['r2']:.3f}\n"
+        f"RMSE = ${metrics['rmse']:,.0f}\n"
+        f"MAE = ${metrics['mae']:,.0f}"
+    )
 
     # Add text box in bottom-left corner
     fig.text(
@@ -204,6 +210,10 @@ def create_model_analysis_figure(
     Returns:
         Complete matplotlib figure with all analysis plots
     """
+    # Prices fit comfortably in float32, which halves the data every plot reads
+    y_actual = y_actual.astype(np.float32)
+    y_predicted = y_predicted.astype(np.float32, copy=False)
+
     # Create figure with 2x2 subplot grid
     fig, axes = plt.subplots(2, 2, figsize=figure_size)
     fig.suptitle("Linear Regression Model Analysis", fontsize=16, fontweight="bold")
@@ -217,8 +227,10 @@ def create_model_analysis_figure(
     # Add metrics text box
     add_metrics_text_box(fig, y_actual, y_predicted)
 
-    # Adjust layout
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.93, bottom=0.12)
+    # Fixed margins instead of tight_layout, which measures every artist first
+    # (the left margin leaves room for the feature names)
+    fig.subplots_adjust(
+        top=0.93, bottom=0.12, left=0.13, right=0.97, hspace=0.2, wspace=0.3
+    )
 
     return fig
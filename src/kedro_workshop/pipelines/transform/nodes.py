@@ -11,70 +11,119 @@ from .geo_utils import find_nearest_locations
 logger = logging.getLogger(__name__)
 
 
-def create_feature_set(
-    hdb_resale_prices: pd.DataFrame,
+def compute_address_distance_features(
     hdb_addresses: pd.DataFrame,
     mrt_stations: pd.DataFrame,
     mrt_geodata: pd.DataFrame,
     mall_geodata: pd.DataFrame,
 ) -> pd.DataFrame:
-    """Create machine learning ready feature set with distance-based features.
+    """Calculate distance-based features for each HDB address.
 
-    This function combines HDB resale transaction data with geographic proximity
-    features by calculating distances to the nearest MRT station and shopping mall
-    for each property address.
+    The distances only depend on the (rarely changing) address, MRT and mall
+    data, so they are stored as their own dataset instead of being recomputed
+    whenever the resale prices change.
 
     The process:
     1. Filters MRT geodata to include only operational stations
     2. Calculates nearest MRT and mall distances for each HDB address
-    3. Joins all data together on address (block + street_name)
-    4. Selects ML-ready numeric features and removes incomplete records
 
     Args:
-        hdb_resale_prices: Clean HDB transaction data with derived features
         hdb_addresses: Clean HDB address coordinates
         mrt_stations: Clean operational MRT station reference data
         mrt_geodata: Clean MRT station geographic coordinates
         mall_geodata: Clean shopping mall geographic coordinates
 
-    Note:
-        Only returns complete records (no missing values) ready for ML modeling.
+    Returns:
+        One row per address (block + street_name) with the name of and the
+        distance to the nearest MRT station and shopping mall
     """
-    logger.info("Creating ML feature set with distance features")
+    logger.info("Calculating distance features for HDB addresses")
 
     # Filter MRT geodata to only include operational stations
-    operational_mrt = mrt_geodata[mrt_geodata["name"].isin(mrt_stations["Name"])]
+    operational_names = frozenset(mrt_stations["Name"].astype(str))
+    operational_mrt = mrt_geodata[mrt_geodata["name"].isin(operational_names)]
     logger.info(
         f"Filtered to {len(operational_mrt)} operational MRT stations (from {len(mrt_geodata)} total)"
     )
 
+    # Distances only depend on the address, so compute them once per address
+    unique_addresses = hdb_addresses.drop_duplicates(subset=["block", "street_name"])
+
     # Find nearest MRT and Mall for each address
-    mrt_distances = find_nearest_locations(hdb_addresses, operational_mrt, "mrt")
-    mall_distances = find_nearest_locations(hdb_addresses, mall_geodata, "mall")
+    mrt_distances = find_nearest_locations(unique_addresses, operational_mrt, "mrt")
+    mall_distances = find_nearest_locations(unique_addresses, mall_geodata, "mall")
+
+    # Use categorical join keys with categories shared by every frame joined on
+    # the address, so the merges compare integer codes instead of hashing strings
+    address_key_dtypes = {
+        key: pd.CategoricalDtype(unique_addresses[key].dropna().unique())
+        for key in ["block", "street_name"]
+    }
+    mrt_distances = mrt_distances.astype(address_key_dtypes)
+    mall_distances = mall_distances.astype(address_key_dtypes)
 
     # Join distance features
     address_features = mrt_distances.merge(
         mall_distances, on=["block", "street_name"], how="inner"
     )
 
-    # Join with HDB resale prices
-    feature_set = hdb_resale_prices.merge(
-        address_features, on=["block", "street_name"], how="inner"
-    )
+    logger.info(f"Distance features for {len(address_features)} addresses")
+    return address_features
+
+
+def join_feature_set(
+    hdb_resale_prices: pd.DataFrame, address_features: pd.DataFrame, random_state: int
+) -> pd.DataFrame:
+    """Create machine learning ready feature set with distance-based features.
+
+    This function combines HDB resale transaction data with the geographic
+    proximity features from ``compute_address_distance_features``.
+
+    The process:
+    1. Selects ML-ready numeric features and removes incomplete records
+    2. Joins resale prices and distance features on address (block + street_name)
+    3. Shuffles the records once, so the model pipeline can split them into
+       train and test sets with contiguous slices
+
+    Args:
+        hdb_resale_prices: Clean HDB transaction data with derived features
+        address_features: Nearest MRT and mall distances per address
+        random_state: Seed for shuffling the records
+
+    Note:
+        Only returns complete records (no missing values) ready for ML modeling.
+    """
+    logger.info("Creating ML feature set with distance features")
 
     # Select ML-ready features
-    ml_features = [
+    price_features = [
         "resale_price",  # target
         "floor_area_sqm",
         "room_count",
         "remaining_lease_months",
         "storey_median",
-        "nearest_mrt_distance_km",
-        "nearest_mall_distance_km",
     ]
+    distance_features = ["nearest_mrt_distance_km", "nearest_mall_distance_km"]
+    ml_features = price_features + distance_features
+
+    # Keep only the needed columns and complete cases on both sides before
+    # joining, so the merge doesn't copy columns that are discarded afterwards
+    join_keys = ["block", "street_name"]
+    needed_prices = hdb_resale_prices[join_keys + price_features]
+
+    # Cast the price join keys to the address features' categorical dtypes, so
+    # the merge compares codes (addresses without distance features become NA)
+    key_dtypes = address_features.dtypes[join_keys].to_dict()
+    needed_prices = needed_prices.astype(key_dtypes).dropna()
+    needed_addresses = address_features[join_keys + distance_features].dropna()
+
+    # Join with HDB resale prices
+    feature_set = needed_prices.merge(needed_addresses, on=join_keys, how="inner")
+    feature_set = feature_set.drop(columns=join_keys)
 
-    # Keep only complete cases
-    feature_set = feature_set[ml_features].dropna()
+    # Shuffle once here instead of on every train/test split
+    feature_set = feature_set.sample(frac=1, random_state=random_state)
+    feature_set = feature_set.reset_index(drop=True)
 
     logger.info(
         f"Final feature set: {len(feature_set)} records with {len(ml_features)} features"
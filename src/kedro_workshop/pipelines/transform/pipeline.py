@@ -7,7 +7,7 @@ is joining the different datasets and adding geographic proximity features.
 
 from kedro.pipeline import Node, Pipeline
 
-from .nodes import create_feature_set
+from .nodes import compute_address_distance_features, join_feature_set
 
 
 def create_pipeline(**kwargs) -> Pipeline:
@@ -17,21 +17,32 @@ def create_pipeline(**kwargs) -> Pipeline:
     ML-ready feature sets with geographic proximity features.
 
     The main transformation calculates distance-based features by finding
-    the nearest MRT station and shopping mall for each HDB address.
+    the nearest MRT station and shopping mall for each HDB address. These are
+    stored separately (address_features), as they only change when the
+    address, MRT or mall data changes, and then joined with the resale prices.
     """
     return Pipeline(
         [
             Node(
-                func=create_feature_set,
+                func=compute_address_distance_features,
                 inputs=[
-                    "clean_hdb_resale_prices",
                     "clean_hdb_address_geodata",
                     "clean_mrt_stations",
                     "clean_mrt_geodata",
                     "clean_mall_geodata",
                 ],
+                outputs="address_features",
+                name="compute_address_distance_features_node",
+            ),
+            Node(
+                func=join_feature_set,
+                inputs=[
+                    "clean_hdb_resale_prices",
+                    "address_features",
+                    "params:transform.random_state",
+                ],
                 outputs="transformed_feature_set",
-                name="create_feature_set_node",
+                name="join_feature_set_node",
             ),
         ]
     )
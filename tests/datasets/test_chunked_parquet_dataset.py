@@ -0,0 +1,96 @@
+"""
+Tests for saving DataFrames chunk by chunk with ``ChunkedParquetDataset``.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from kedro.io import DatasetError
+
+from kedro_workshop.datasets import ChunkedParquetDataset
+
+
+@pytest.fixture
+def filepath(tmp_path):
+    return str(tmp_path / "hdb_resale_prices")
+
+
+def _save_chunks(filepath, chunks, **kwargs):
+    dataset = ChunkedParquetDataset(filepath=filepath, **kwargs)
+    for chunk in chunks:
+        dataset.save(chunk)
+    return dataset
+
+
+class TestChunkedParquetDataset:
+    def test_loads_chunks_in_order(self, filepath):
+        chunks = [pd.DataFrame({"block": [str(i)] * 3}) for i in range(12)]
+
+        dataset = _save_chunks(filepath, chunks)
+
+        expected = pd.concat(chunks, ignore_index=True)
+        pd.testing.assert_frame_equal(dataset.load(), expected)
+
+    def test_new_instance_replaces_stale_parts(self, filepath):
+        _save_chunks(filepath, [pd.DataFrame({"x": [1]}), pd.DataFrame({"x": [2]})])
+
+        dataset = _save_chunks(filepath, [pd.DataFrame({"x": [3]})])
+
+        assert dataset.load()["x"].tolist() == [3]
+
+    def test_release_starts_a_new_write(self, filepath):
+        dataset = _save_chunks(filepath, [pd.DataFrame({"x": [1]})])
+
+        dataset.release()
+        dataset.save(pd.DataFrame({"x": [2]}))
+
+        assert dataset.load()["x"].tolist() == [2]
+
+    def test_promotes_empty_first_chunk(self, filepath):
+        chunks = [
+            pd.DataFrame({"remaining_lease": [np.nan, np.nan]}, dtype=object),
+            pd.DataFrame({"remaining_lease": ["61 years 04 months", None]}),
+        ]
+
+        dataset = _save_chunks(filepath, chunks)
+
+        assert dataset.load()["remaining_lease"].tolist() == [
+            None,
+            None,
+            "61 years 04 months",
+            None,
+        ]
+
+    def test_promotes_integers_to_floats(self, filepath):
+        chunks = [
+            pd.DataFrame({"floor_area_sqm": [60, 70]}),
+            pd.DataFrame({"floor_area_sqm": [60.5]}),
+        ]
+
+        dataset = _save_chunks(filepath, chunks)
+
+        loaded = dataset.load()["floor_area_sqm"]
+        assert loaded.dtype == np.float64
+        assert loaded.tolist() == [60.0, 70.0, 60.5]
+
+    def test_incompatible_chunk_raises(self, filepath):
+        dataset = _save_chunks(filepath, [pd.DataFrame({"block": [216]})])
+
+        with pytest.raises(DatasetError, match="Chunk 1 doesn't match"):
+            dataset.save(pd.DataFrame({"block": ["10A"]}))
+
+    def test_load_args(self, filepath):
+        dataset = _save_chunks(
+            filepath,
+            [pd.DataFrame({"town": ["ANG MO KIO"]})],
+            load_args={"dtype_backend": "pyarrow"},
+        )
+
+        assert isinstance(dataset.load()["town"].dtype, pd.ArrowDtype)
+
+    def test_exists(self, filepath):
+        dataset = ChunkedParquetDataset(filepath=filepath)
+        assert not dataset.exists()
+
+        dataset.save(pd.DataFrame({"x": [1]}))
+        assert dataset.exists()
@@ -0,0 +1,102 @@
+"""
+Tests for loading Overpass API responses with ``OverpassDataset`` and its
+on-disk response cache. The API itself is replaced by canned responses.
+"""
+
+import io
+
+import orjson
+import pytest
+import requests
+
+from kedro_workshop.datasets import OverpassDataset, overpass_dataset
+
+QUERY = '[out:json];node["subway"="yes"];out;'
+
+
+def _response(status_code, payload):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(orjson.dumps(payload))
+    return response
+
+
+@pytest.fixture
+def fetch(monkeypatch):
+    """Replace the API call with one returning the queued responses."""
+    responses = []
+    calls = []
+
+    def fake_fetch_overpass(query, url, timeout):
+        calls.append(query)
+        return responses.pop(0)
+
+    monkeypatch.setattr(overpass_dataset, "fetch_overpass", fake_fetch_overpass)
+    return responses, calls
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    return OverpassDataset(query=QUERY, cache_dir=str(tmp_path / "cache"))
+
+
+class TestOverpassDataset:
+    def test_cache_miss_fetches_and_caches(self, fetch, dataset, tmp_path):
+        responses, calls = fetch
+        payload = {"elements": [{"type": "node", "id": 1}]}
+        responses.append(_response(200, payload))
+
+        response = dataset.load()
+
+        assert calls == [QUERY]
+        assert orjson.loads(response.content) == payload
+        assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def test_cache_hit_skips_the_api(self, fetch, dataset):
+        responses, calls = fetch
+        payload = {"elements": [{"type": "node", "id": 1}]}
+        responses.append(_response(200, payload))
+        dataset.load()
+
+        response = dataset.load()
+
+        assert calls == [QUERY]
+        assert response.status_code == requests.codes.ok
+        assert orjson.loads(response.content) == payload
+        assert response.json() == payload
+
+    def test_error_response_is_not_cached(self, fetch, dataset, tmp_path):
+        responses, calls = fetch
+        responses.append(
+            _response(requests.codes.gateway_timeout, {"error": "Gateway Timeout"})
+        )
+        responses.append(_response(200, {"elements": []}))
+
+        assert dataset.load().status_code == requests.codes.gateway_timeout
+        assert not (tmp_path / "cache").exists()
+        assert dataset.load().status_code == requests.codes.ok
+        assert calls == [QUERY, QUERY]
+
+    def test_result_with_remark_is_not_cached(self, fetch, dataset):
+        responses, calls = fetch
+        partial = {
+            "elements": [{"type": "node", "id": 1}],
+            "remark": 'runtime error: Query timed out in "query" at line 1',
+        }
+        responses.append(_response(200, partial))
+        responses.append(_response(200, {"elements": []}))
+
+        dataset.load()
+        dataset.load()
+
+        assert calls == [QUERY, QUERY]
+
+    def test_without_cache_dir_always_fetches(self, fetch):
+        responses, calls = fetch
+        responses.extend(_response(200, {"elements": []}) for _ in range(2))
+        dataset = OverpassDataset(query=QUERY)
+
+        dataset.load()
+        dataset.load()
+
+        assert calls == [QUERY, QUERY]
@@ -0,0 +1,133 @@
+"""
+Tests for the vectorized parsing helpers of the clean pipeline. The expected
+values are those of the original per-row parsers.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from kedro_workshop.pipelines.clean.utils import (
+    STRING_DTYPE,
+    count_mrt_station_lines,
+    extract_room_count,
+    parse_remaining_lease,
+    parse_storey_range,
+)
+
+
+class TestParseRemainingLease:
+    def _parse(self, remaining_lease, lease_commence_date=1990.0, sale_year=2020):
+        n = len(remaining_lease)
+        return parse_remaining_lease(
+            remaining_lease,
+            pd.Series([lease_commence_date] * n),
+            pd.Series(pd.to_datetime([f"{sale_year}-06-01"] * n)),
+        ).tolist()
+
+    @pytest.mark.parametrize("dtype", [object, STRING_DTYPE])
+    def test_strings(self, dtype):
+        remaining_lease = pd.Series(
+            ["56 years 09 months", "63 years", "11 months", "61 YEARS 4 MONTHS"],
+            dtype=dtype,
+        )
+
+        assert self._parse(remaining_lease) == [681, 756, 11, 736]
+
+    def test_numeric_years(self):
+        remaining_lease = pd.Series([70.0, 61.5])
+
+        assert self._parse(remaining_lease) == [840, 738]
+
+    def test_numeric_years_read_as_strings(self):
+        remaining_lease = pd.Series(["70", "61.5"], dtype=STRING_DTYPE)
+
+        assert self._parse(remaining_lease) == [840, 738]
+
+    @pytest.mark.parametrize(
+        "dtype", [object, STRING_DTYPE, pd.ArrowDtype(pa.string())]
+    )
+    def test_mixed_text_numeric_and_missing(self, dtype):
+        # pd.ArrowDtype(pa.string()) is what the staging Parquet loads as
+        remaining_lease = pd.Series(
+            ["61 years 04 months", "70", None, "61.5"], dtype=dtype
+        )
+
+        assert self._parse(remaining_lease) == [736, 840, 828, 738]
+
+    def test_missing_falls_back_to_lease_commence_date(self):
+        remaining_lease = pd.Series([None, np.nan], dtype=object)
+
+        # 99-year lease from 1990, sold in 2020: 69 years left
+        assert self._parse(remaining_lease) == [828, 828]
+
+    def test_missing_lease_before_sale_gives_zero(self):
+        remaining_lease = pd.Series([None], dtype=object)
+
+        assert self._parse(remaining_lease, lease_commence_date=1900.0) == [0]
+
+    def test_missing_without_fallback_gives_zero(self):
+        remaining_lease = pd.Series([None], dtype=object)
+
+        assert self._parse(remaining_lease, lease_commence_date=np.nan) == [0]
+
+    def test_keeps_index(self):
+        remaining_lease = pd.Series(["63 years"], index=[42])
+
+        result = parse_remaining_lease(
+            remaining_lease,
+            pd.Series([1990.0], index=[42]),
+            pd.Series(pd.to_datetime(["2020-06-01"]), index=[42]),
+        )
+
+        assert result.index.tolist() == [42]
+
+
+class TestExtractRoomCount:
+    def test_room_counts(self):
+        flat_type = pd.Series(["1 ROOM", "3 ROOM", " 5 room "])
+
+        assert extract_room_count(flat_type).tolist() == [1, 3, 5]
+
+    def test_special_flat_types(self):
+        flat_type = pd.Series(["EXECUTIVE", "MULTI-GENERATION", "multi-generation"])
+
+        assert extract_room_count(flat_type).tolist() == [6, 6, 6]
+
+    def test_missing_or_unrecognised(self):
+        flat_type = pd.Series([None, np.nan, "STUDIO"], dtype=object)
+
+        assert extract_room_count(flat_type).tolist() == [0, 0, 0]
+
+
+class TestCountMrtStationLines:
+    def test_codes(self):
+        station_code = pd.Series(["NS1", "NS1 EW24", "NE6 NS24  CC1 "])
+
+        assert count_mrt_station_lines(station_code).tolist() == [1, 2, 3]
+
+    def test_empty_or_missing(self):
+        station_code = pd.Series(["", "  ", None], dtype=object)
+
+        assert count_mrt_station_lines(station_code).tolist() == [0, 0, 0]
+
+
+class TestParseStoreyRange:
+    def test_ranges(self):
+        storey_range = pd.Series(["04 TO 06", "10 TO 12"])
+
+        storey_min, storey_max, storey_median = parse_storey_range(storey_range)
+
+        assert storey_min.tolist() == [4, 10]
+        assert storey_max.tolist() == [6, 12]
+        assert storey_median.tolist() == [5.0, 11.0]
+
+    def test_missing_or_unparseable(self):
+        storey_range = pd.Series([None, "BASEMENT"], dtype=object)
+
+        storey_min, storey_max, storey_median = parse_storey_range(storey_range)
+
+        assert storey_min.tolist() == [0, 0]
+        assert storey_max.tolist() == [0, 0]
+        assert storey_median.tolist() == [0.0, 0.0]
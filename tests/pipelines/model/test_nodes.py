@@ -0,0 +1,113 @@
+"""
+Tests for the model pipeline's linear regression fit and metrics, compared
+against scikit-learn on float32 and float64 inputs.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import (
+    mean_absolute_error,
+    mean_squared_error,
+    r2_score,
+    root_mean_squared_error,
+)
+
+from kedro_workshop.pipelines.model.metrics import calculate_regression_metrics
+from kedro_workshop.pipelines.model.nodes import _fit_linear_regression
+
+
+@pytest.fixture
+def feature_set():
+    """HDB-like features with prices of a few hundred thousand dollars."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    X = pd.DataFrame(
+        {
+            "floor_area_sqm": rng.uniform(40, 150, n),
+            "room_count": rng.integers(1, 7, n).astype(float),
+            "remaining_lease_months": rng.uniform(500, 1188, n),
+            "storey_median": rng.integers(1, 40, n) * 3 - 1.0,
+            "nearest_mrt_distance_km": rng.uniform(0.1, 3, n),
+            "nearest_mall_distance_km": rng.uniform(0.1, 3, n),
+        }
+    )
+    coef = np.array([4000, 10000, 300, 3000, -40000, -20000])
+    y = pd.Series(
+        50000 + X.to_numpy() @ coef + rng.normal(0, 50000, n), name="resale_price"
+    )
+    return X, y
+
+
+class TestFitLinearRegression:
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_matches_sklearn(self, feature_set, dtype):
+        X, y = feature_set
+        expected = LinearRegression().fit(X, y)
+
+        model = _fit_linear_regression(X.astype(dtype), y.astype(dtype))
+
+        np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-4)
+        np.testing.assert_allclose(model.intercept_, expected.intercept_, rtol=1e-4)
+        assert list(model.feature_names_in_) == list(X.columns)
+
+    def test_float32_r2_matches_float64(self, feature_set):
+        X, y = feature_set
+        model_64 = _fit_linear_regression(X, y)
+        model_32 = _fit_linear_regression(X.astype(np.float32), y.astype(np.float32))
+
+        r2_64 = r2_score(y, model_64.predict(X))
+        r2_32 = r2_score(y, model_32.predict(X.astype(np.float32)))
+
+        assert r2_32 == pytest.approx(r2_64, abs=1e-5)
+
+    def test_ill_conditioned_falls_back_to_sklearn(self, feature_set):
+        X, y = feature_set
+        X = X.assign(floor_area_sqft=X["floor_area_sqm"] * 10.7639)
+
+        model = _fit_linear_regression(X, y)
+
+        np.testing.assert_allclose(
+            model.predict(X), LinearRegression().fit(X, y).predict(X), rtol=1e-6
+        )
+
+
+class TestCalculateRegressionMetrics:
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_matches_sklearn(self, feature_set, dtype):
+        X, y = feature_set
+        y_pred = LinearRegression().fit(X, y).predict(X)
+        y_true = y.astype(dtype)
+        y_pred = y_pred.astype(dtype)
+
+        metrics = calculate_regression_metrics(y_true, y_pred)
+
+        # sklearn upcasts to float64, so compare against that
+        y_true_64 = y_true.astype(np.float64)
+        y_pred_64 = y_pred.astype(np.float64)
+        assert metrics["r2"] == pytest.approx(r2_score(y_true_64, y_pred_64), abs=1e-5)
+        assert metrics["mse"] == pytest.approx(
+            mean_squared_error(y_true_64, y_pred_64), rel=1e-5
+        )
+        assert metrics["mae"] == pytest.approx(
+            mean_absolute_error(y_true_64, y_pred_64), rel=1e-5
+        )
+        assert metrics["rmse"] == pytest.approx(
+            root_mean_squared_error(y_true_64, y_pred_64), rel=1e-5
+        )
+
+    @pytest.mark.parametrize(
+        "y_pred, expected_r2", [([3.0, 3.0, 3.0], 1.0), ([2.0, 3.0, 4.0], 0.0)]
+    )
+    def test_constant_target(self, y_pred, expected_r2):
+        y_true = pd.Series([3.0, 3.0, 3.0])
+        y_pred = np.array(y_pred)
+
+        metrics = calculate_regression_metrics(y_true, y_pred)
+
+        assert metrics["r2"] == r2_score(y_true, y_pred) == expected_r2
+
+    def test_empty_input_raises(self):
+        with pytest.raises(ValueError, match="without any values"):
+            calculate_regression_metrics(pd.Series([], dtype=float), np.array([]))
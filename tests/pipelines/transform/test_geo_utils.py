@@ -0,0 +1,128 @@
+"""
+Tests for the nearest location search of the transform pipeline, compared
+against a brute-force search with the Haversine distance.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kedro_workshop.pipelines.transform.geo_utils import (
+    calculate_distance_km,
+    find_nearest_locations,
+)
+
+HDB_ADDRESSES = pd.DataFrame(
+    {
+        "block": ["406", "233", "10A", "601", "880", "302", "16", "112"],
+        "street_name": [
+            "ANG MO KIO AVE 10",
+            "BISHAN ST 22",
+            "BOON TIONG RD",
+            "JURONG WEST ST 65",
+            "TAMPINES ST 84",
+            "WOODLANDS ST 31",
+            "TELOK BLANGAH CRES",
+            "PUNGGOL FIELD",
+        ],
+        "latitude": [1.3622, 1.3587, 1.2863, 1.3401, 1.3556, 1.4306, 1.2738, 1.4050],
+        "longitude": [
+            103.8557,
+            103.8466,
+            103.8288,
+            103.7029,
+            103.9320,
+            103.7754,
+            103.8160,
+            103.9048,
+        ],
+    }
+)
+
+MRT_STATIONS = pd.DataFrame(
+    {
+        "name": [
+            "Ang Mo Kio",
+            "Bishan",
+            "Tiong Bahru",
+            "Raffles Place",
+            "Boon Lay",
+            "Tampines",
+            "Woodlands",
+            "Telok Blangah",
+            "Punggol",
+        ],
+        "latitude": [
+            1.3699,
+            1.3510,
+            1.2862,
+            1.2840,
+            1.3386,
+            1.3546,
+            1.4370,
+            1.2707,
+            1.4052,
+        ],
+        "longitude": [
+            103.8496,
+            103.8485,
+            103.8270,
+            103.8515,
+            103.7059,
+            103.9453,
+            103.7865,
+            103.8098,
+            103.9024,
+        ],
+    }
+)
+
+
+def _nearest_by_haversine(source, target):
+    """Nearest target name and distance for each source, checking every pair."""
+    distances = calculate_distance_km(
+        source["latitude"].to_numpy()[:, None],
+        source["longitude"].to_numpy()[:, None],
+        target["latitude"].to_numpy()[None, :],
+        target["longitude"].to_numpy()[None, :],
+    )
+    nearest = distances.argmin(axis=1)
+    return target["name"].to_numpy()[nearest], distances.min(axis=1)
+
+
+class TestFindNearestLocations:
+    def test_matches_haversine_search(self):
+        expected_names, expected_distances = _nearest_by_haversine(
+            HDB_ADDRESSES, MRT_STATIONS
+        )
+
+        result = find_nearest_locations(HDB_ADDRESSES, MRT_STATIONS, "mrt")
+
+        assert result["nearest_mrt_name"].tolist() == expected_names.tolist()
+        np.testing.assert_allclose(
+            result["nearest_mrt_distance_km"], expected_distances, rtol=1e-3
+        )
+
+    def test_keeps_addresses_in_order(self):
+        result = find_nearest_locations(HDB_ADDRESSES, MRT_STATIONS, "mrt")
+
+        assert result.columns.tolist() == [
+            "block",
+            "street_name",
+            "nearest_mrt_name",
+            "nearest_mrt_distance_km",
+        ]
+        pd.testing.assert_frame_equal(
+            result[["block", "street_name"]],
+            HDB_ADDRESSES[["block", "street_name"]],
+        )
+
+    def test_location_on_target_has_zero_distance(self):
+        source = MRT_STATIONS.assign(block="1", street_name="ST")
+
+        result = find_nearest_locations(source, MRT_STATIONS, "mrt")
+
+        assert result["nearest_mrt_name"].tolist() == MRT_STATIONS["name"].tolist()
+        assert result["nearest_mrt_distance_km"].tolist() == pytest.approx(
+            [0.0] * len(MRT_STATIONS)
+        )